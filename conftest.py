@@ -0,0 +1 @@
+# keeps the repo root importable (train.py, model_registry.py, preprocess_dataset) under a plain `pytest` run
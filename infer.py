@@ -1,17 +1,7 @@
 import argparse
 from pathlib import Path
 import sys
-import json
-import joblib
-
-
-def load_artifacts(model_dir: Path):
-    model = joblib.load(model_dir / "model.joblib")
-    vectorizer = joblib.load(model_dir / "vectorizer.joblib")
-    label_encoder = joblib.load(model_dir / "label_encoder.joblib")
-    meta_path = model_dir / "metadata.json"
-    metadata = json.loads(meta_path.read_text()) if meta_path.exists() else {}
-    return model, vectorizer, label_encoder, metadata
+from model_registry import load_artifacts
 
 
 def read_inputs(args):
@@ -0,0 +1,226 @@
+from pathlib import Path
+from datetime import datetime
+import json
+import os
+import threading
+import time
+import joblib
+
+ARTIFACTS = ("model", "vectorizer", "label_encoder")
+CURRENT = "CURRENT"
+
+
+def read_metadata(model_dir: Path):
+    meta_path = model_dir / "metadata.json"
+    return json.loads(meta_path.read_text()) if meta_path.exists() else {}
+
+
+def resolve_version_dir(model_dir: Path):
+    '''
+    train.py saves every version to its own subdir and points model_dir/CURRENT at it.
+    returns the dir holding the artifacts: the CURRENT version, or model_dir itself for the older flat layout
+    '''
+    pointer = model_dir / CURRENT
+    if pointer.is_file():
+        return model_dir / pointer.read_text().strip()
+    return model_dir
+
+
+def save_version(out_dir: Path, model, vectorizer, label_encoder, meta, version=None):
+    '''
+    save one version to out_dir/<version>/ and switch out_dir/CURRENT to it with a single rename,
+    so a ModelRegistry (or infer.py) only ever sees a complete version. version defaults to a utc
+    timestamp, which is also used as meta['saved_at'] if that is not set. returns the version dir
+    '''
+    if version is None:
+        now = datetime.utcnow()
+        version = now.strftime("%Y%m%dT%H%M%S%fZ")
+        meta = {**meta, "saved_at": meta.get("saved_at") or now.isoformat() + "Z"}
+    out_dir = Path(out_dir)
+    version_dir = out_dir / version
+    version_dir.mkdir(parents=True)
+
+    joblib.dump(model, version_dir / "model.joblib")
+    joblib.dump(vectorizer, version_dir / "vectorizer.joblib")
+    joblib.dump(label_encoder, version_dir / "label_encoder.joblib")
+    (version_dir / "metadata.json").write_text(json.dumps(meta, indent=2))
+
+    current_tmp = out_dir / (CURRENT + ".tmp")
+    current_tmp.write_text(version + "\n")
+    os.replace(current_tmp, out_dir / CURRENT)
+    return version_dir
+
+
+def load_artifacts(model_dir: Path, mmap_mode="r"):
+    '''
+    load model, vectorizer and label encoder from a saved model dir (its CURRENT version if it has one).
+    with mmap_mode='r' numpy arrays that are stored as plain attributes (e.g. LogisticRegression.coef_)
+    are memory-mapped read-only and shared between processes; everything else is unpickled per process
+    '''
+    return load_version(resolve_version_dir(model_dir), mmap_mode=mmap_mode)
+
+
+def load_version(version_dir: Path, mmap_mode="r"):
+    model = joblib.load(version_dir / "model.joblib", mmap_mode=mmap_mode)
+    vectorizer = joblib.load(version_dir / "vectorizer.joblib", mmap_mode=mmap_mode)
+    label_encoder = joblib.load(version_dir / "label_encoder.joblib", mmap_mode=mmap_mode)
+    metadata = read_metadata(version_dir)
+    return model, vectorizer, label_encoder, metadata
+
+
+class ModelEntry:
+    '''
+    one indexed model version. artifacts are only loaded on first access.
+    path is the version dir resolved at index time, so a later save never changes what this entry loads.
+    dirs in the older flat layout (no CURRENT) are assumed to be immutable: nothing in this repo writes them
+    anymore, and a rewrite while they are being loaded can return artifacts from different saves
+    '''
+
+    def __init__(self, name, path: Path, metadata, mmap_mode="r"):
+        self.name = name
+        self.path = path
+        self.metadata = metadata
+        self.mmap_mode = mmap_mode
+        self._artifacts = None
+        self._lock = threading.Lock()
+
+    @property
+    def model_type(self):
+        return self.metadata.get("model_type")
+
+    @property
+    def dataset(self):
+        return self.metadata.get("dataset")
+
+    @property
+    def classes(self):
+        return self.metadata.get("classes", [])
+
+    @property
+    def saved_at(self):
+        return self.metadata.get("saved_at")
+
+    @property
+    def loaded(self):
+        return self._artifacts is not None
+
+    def load(self):
+        '''
+        returns (model, vectorizer, label_encoder, metadata), loading them once
+        '''
+        if self._artifacts is None:
+            with self._lock:
+                if self._artifacts is None:
+                    self._artifacts = load_version(self.path, mmap_mode=self.mmap_mode)
+        return self._artifacts
+
+
+class ModelRegistry:
+    '''
+    indexes the model dirs under root (default saved_models/) by their metadata.json
+    and hands out lazily loaded artifacts.
+
+    when a model is re-saved (CURRENT points at a new version dir) refresh() builds a new
+    entry and swaps it in atomically: callers that already hold the old artifacts keep
+    using them, new calls to get() see the new version. no restart needed.
+    '''
+
+    def __init__(self, root="saved_models", mmap_mode="r", refresh_interval=None):
+        self.root = Path(root)
+        self.mmap_mode = mmap_mode
+        self.refresh_interval = refresh_interval
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._last_refresh = 0.0
+        self.refresh()
+
+    def _scan(self):
+        '''
+        returns ({name: (version_dir, metadata)}, names that exist but could not be read right now)
+        '''
+        found, unreadable = {}, set()
+        if not self.root.is_dir():
+            return found, unreadable
+        for model_dir in sorted(self.root.iterdir()):
+            if not model_dir.is_dir():
+                continue
+            try:
+                version_dir = resolve_version_dir(model_dir)
+                if not (version_dir / "metadata.json").is_file():
+                    if (model_dir / CURRENT).is_file():
+                        # CURRENT points at a version that is missing or incomplete
+                        unreadable.add(model_dir.name)
+                    continue
+                if not all((version_dir / f"{a}.joblib").is_file() for a in ARTIFACTS):
+                    unreadable.add(model_dir.name)
+                    continue
+                found[model_dir.name] = (version_dir, read_metadata(version_dir))
+            except (OSError, json.JSONDecodeError):
+                # being written right now; keep what we have and pick it up on the next refresh
+                unreadable.add(model_dir.name)
+        return found, unreadable
+
+    def refresh(self):
+        '''
+        rescan root and swap in entries that are new or point at a different version.
+        entries whose dir or metadata.json is gone are dropped; unreadable ones are kept as they are.
+        returns the names of the entries that changed
+        '''
+        found, unreadable = self._scan()
+        changed = []
+        with self._lock:
+            entries = dict(self._entries)
+            for name, (version_dir, metadata) in found.items():
+                current = entries.get(name)
+                if current is None or current.path != version_dir or current.saved_at != metadata.get("saved_at"):
+                    entries[name] = ModelEntry(name, version_dir, metadata, mmap_mode=self.mmap_mode)
+                    changed.append(name)
+            for name in set(entries) - set(found) - unreadable:
+                del entries[name]
+                changed.append(name)
+            # replace the whole mapping at once so readers never see a half-updated index
+            self._entries = entries
+            self._last_refresh = time.monotonic()
+        return changed
+
+    def _maybe_refresh(self):
+        if self.refresh_interval is None:
+            return
+        if time.monotonic() - self._last_refresh >= self.refresh_interval:
+            self.refresh()
+
+    def names(self):
+        self._maybe_refresh()
+        return list(self._entries)
+
+    def entries(self):
+        self._maybe_refresh()
+        return list(self._entries.values())
+
+    def find(self, model_type=None, dataset=None):
+        '''
+        entries matching the given metadata fields, newest saved_at first
+        '''
+        matches = [e for e in self.entries()
+                   if (model_type is None or e.model_type == model_type)
+                   and (dataset is None or e.dataset == dataset)]
+        return sorted(matches, key=lambda e: e.saved_at or "", reverse=True)
+
+    def entry(self, name):
+        self._maybe_refresh()
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f"No model named '{name}' in {self.root}. Available: {list(self._entries)}") from None
+
+    def get(self, name):
+        '''
+        returns (model, vectorizer, label_encoder, metadata) for the current version of name
+        '''
+        return self.entry(name).load()
+
+
+if __name__ == "__main__":
+    registry = ModelRegistry()
+    for e in registry.entries():
+        print(f"{e.name}\t{e.model_type}\t{e.dataset}\t{e.saved_at}\t{len(e.classes)} classes")
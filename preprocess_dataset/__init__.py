@@ -1,5 +1,5 @@
 from .dataio import load_data_to_df
 from .split import stratified_split
-from .vectorize import vectorize_fit_transform
+from .vectorize import vectorize_fit_transform, build_vectorizer, resolve_features, feature_report
 from .encode import encode_labels
 from .prepare import prepare_dataset
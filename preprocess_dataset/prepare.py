@@ -1,9 +1,8 @@
 from collections import Counter
 from .dataio import load_data_to_df
 from .split import stratified_split
-from .vectorize import vectorize_fit_transform
+from .vectorize import vectorize_fit_transform, resolve_features, build_vectorizer, feature_report, print_feature_report
 from .encode import encode_labels
-from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.preprocessing import LabelEncoder
 
 def summarize_labels(y_train, y_test):
@@ -17,7 +16,10 @@ def summarize_labels(y_train, y_test):
 
     return train_counts, test_counts
 
-def prepare_dataset(path):
+def prepare_dataset(path, features=None):
+    '''
+    features is an optional feature config (see vectorize.DEFAULT_FEATURES); omitted keys keep their defaults
+    '''
     df = load_data_to_df(path)
 
     # Ensure stratified split works: drop labels with <2 samples
@@ -30,9 +32,14 @@ def prepare_dataset(path):
     # split the dataset into train test
     x_train, x_test, y_train, y_test = stratified_split(df, test_size=0.15)
 
-    # create an instance of the CountVectorizer and vectorize x_train and x_test
-    vectorizer = CountVectorizer()
-    x_train_transformed, x_test_transformed = vectorize_fit_transform(vectorizer, x_train, x_test)
+    # build the vectorizer from the feature config and vectorize x_train and x_test
+    features = resolve_features(features)
+    vectorizer = build_vectorizer(features)
+    try:
+        x_train_transformed, x_test_transformed = vectorize_fit_transform(vectorizer, x_train, x_test)
+    except ValueError as e:
+        # e.g. min_df above the number of documents, or pruning that leaves no terms
+        raise ValueError(f"Feature config does not fit this dataset ({len(x_train)} training utterances): {e}") from e
 
     # encode the labels
     encoder = LabelEncoder()
@@ -41,12 +48,18 @@ def prepare_dataset(path):
     # get a summary of the train test split and the label distribution
     summarize_labels(y_train, y_test)
 
+    # size and speed of the chosen feature set
+    report = feature_report(vectorizer, x_train, x_train_transformed)
+    print_feature_report(report)
+
     return {'x_train': x_train_transformed,
             'x_test': x_test_transformed,
             'y_train': y_train_encoded,
             'y_test': y_test_encoded,
             'encoder': encoder,
-            'vectorizer': vectorizer}
+            'vectorizer': vectorizer,
+            'features': features,
+            'feature_report': report}
 
 if __name__ == '__main__':
     prepare_dataset('datasets/dialog_acts_deduplicated.dat')
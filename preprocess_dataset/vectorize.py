@@ -1,3 +1,98 @@
+import time
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+# default feature config reproduces the original plain CountVectorizer()
+DEFAULT_FEATURES = {
+    'analyzer': 'word',     # 'word', 'char' or 'char_wb'
+    'ngram_range': [1, 1],
+    'tfidf': False,
+    'binary': False,
+    'max_features': None,
+    'min_df': 1,
+    'dtype': 'int64',       # 'int32', 'int64', 'float32' or 'float64'
+}
+
+DTYPES = {'int32': np.int32, 'int64': np.int64, 'float32': np.float32, 'float64': np.float64}
+
+
+def resolve_features(features=None):
+    '''
+    fill in defaults and validate a feature config. the result is plain json so it can go into metadata.json
+    '''
+    config = dict(DEFAULT_FEATURES)
+    # None means 'not set' (e.g. an omitted cli flag), so it keeps the default
+    config.update({k: v for k, v in (features or {}).items() if v is not None})
+
+    unknown = set(config) - set(DEFAULT_FEATURES)
+    if unknown:
+        raise ValueError(f"Unknown feature option(s): {sorted(unknown)}")
+    if config['analyzer'] not in ('word', 'char', 'char_wb'):
+        raise ValueError(f"analyzer must be 'word', 'char' or 'char_wb', got {config['analyzer']!r}")
+    if config['dtype'] not in DTYPES:
+        raise ValueError(f"dtype must be one of {list(DTYPES)}, got {config['dtype']!r}")
+    if config['tfidf'] and not config['dtype'].startswith('float'):
+        raise ValueError("tfidf weights need a float dtype (float32 or float64)")
+
+    min_df, max_features = config['min_df'], config['max_features']
+    if isinstance(min_df, bool) or not (isinstance(min_df, int) and min_df >= 1
+                                        or isinstance(min_df, float) and 0 < min_df <= 1):
+        raise ValueError(f"min_df must be an int >= 1 or a float in (0, 1], got {min_df!r}")
+    if max_features is not None and not (isinstance(max_features, int) and max_features >= 1):
+        raise ValueError(f"max_features must be a positive int, got {max_features!r}")
+
+    low, high = config['ngram_range']
+    if not 1 <= low <= high:
+        raise ValueError(f"ngram_range must satisfy 1 <= min <= max, got {config['ngram_range']}")
+    config['ngram_range'] = [int(low), int(high)]
+    return config
+
+
+def build_vectorizer(features=None):
+    '''
+    create an unfitted vectorizer from a feature config (e.g. the 'features' entry of metadata.json)
+    '''
+    config = resolve_features(features)
+    vectorizer_cls = TfidfVectorizer if config['tfidf'] else CountVectorizer
+    return vectorizer_cls(analyzer=config['analyzer'],
+                          ngram_range=tuple(config['ngram_range']),
+                          binary=config['binary'],
+                          max_features=config['max_features'],
+                          min_df=config['min_df'],
+                          dtype=DTYPES[config['dtype']])
+
+
+def matrix_nbytes(x):
+    '''
+    memory held by a sparse csr matrix (values + column indices + row pointers)
+    '''
+    return x.data.nbytes + x.indices.nbytes + x.indptr.nbytes
+
+
+def feature_report(vectorizer, x_train, x_train_transformed, repeats=3):
+    '''
+    size of the fitted feature space and matrix, and transform throughput in docs/sec (best of repeats)
+    '''
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        vectorizer.transform(x_train)
+        best = min(best, time.perf_counter() - start)
+
+    return {'n_features': len(vectorizer.vocabulary_),
+            'nnz': int(x_train_transformed.nnz),
+            'dtype': str(x_train_transformed.dtype),
+            'matrix_bytes': int(matrix_nbytes(x_train_transformed)),
+            'transform_docs_per_sec': round(len(x_train) / best, 1) if best > 0 else None}
+
+
+def print_feature_report(report):
+    print('--## Feature Summary ##--')
+    print(f"features={report['n_features']}, nnz={report['nnz']}, dtype={report['dtype']}, "
+          f"matrix={report['matrix_bytes'] / 1024:.1f} KiB, "
+          f"transform={report['transform_docs_per_sec']} docs/sec")
+    print('-----#####-----\n')
+
 
 def vectorize_fit_transform(vectorizer, x_train, x_test):
     '''
@@ -11,10 +106,20 @@ def vectorize_fit_transform(vectorizer, x_train, x_test):
 if __name__ == '__main__':
     from dataio import load_data_to_df
     from split import stratified_split
-    from sklearn.feature_extraction.text import CountVectorizer
 
-    df = load_data_to_df('test_data.txt')
+    df = load_data_to_df('datasets/dialog_acts_deduplicated.dat')
+    # same as prepare_dataset: a stratified split needs at least 2 samples per label
+    label_counts = df['label'].value_counts()
+    df = df[df['label'].isin(label_counts[label_counts >= 2].index)].reset_index(drop=True)
     x_train, x_test, y_train, y_test = stratified_split(df, test_size=0.15)
-    vectorizer = CountVectorizer()
-    x_train_transformed, x_test_transformed = vectorize_fit_transform(vectorizer, x_train, x_test)
-    
+
+    # compare a few feature configs on size and speed
+    configs = [{},
+               {'binary': True, 'dtype': 'int32'},
+               {'tfidf': True, 'dtype': 'float32', 'ngram_range': [1, 2], 'min_df': 2},
+               {'analyzer': 'char_wb', 'ngram_range': [2, 4], 'max_features': 5000, 'dtype': 'float32', 'tfidf': True}]
+    for features in configs:
+        vectorizer = build_vectorizer(features)
+        x_train_transformed, x_test_transformed = vectorize_fit_transform(vectorizer, x_train, x_test)
+        print(resolve_features(features))
+        print_feature_report(feature_report(vectorizer, x_train, x_train_transformed))
@@ -0,0 +1,133 @@
+import json
+import joblib
+import numpy as np
+import pytest
+
+from model_registry import ModelRegistry, load_artifacts, save_version
+
+
+def save(model_dir, version):
+    # the same save train.py does, with a fixed version name
+    return save_version(model_dir, {"version": version, "coef": np.arange(10.0)}, {"version": version},
+                        {"version": version}, {"model_type": "logistic_regression", "saved_at": version},
+                        version=version)
+
+
+def save_flat(model_dir, version):
+    # older layout: artifacts directly in the model dir
+    model_dir.mkdir(parents=True, exist_ok=True)
+    for name in ("model", "vectorizer", "label_encoder"):
+        joblib.dump({"version": version}, model_dir / f"{name}.joblib")
+    (model_dir / "metadata.json").write_text(json.dumps({"model_type": "decision_tree", "saved_at": version}))
+
+
+def test_indexes_versioned_and_flat_dirs(tmp_path):
+    save(tmp_path / "lr", "v1")
+    save_flat(tmp_path / "dt", "v1")
+    (tmp_path / "not_a_model").mkdir()
+
+    registry = ModelRegistry(tmp_path)
+
+    assert sorted(registry.names()) == ["dt", "lr"]
+    assert [e.name for e in registry.find(model_type="decision_tree")] == ["dt"]
+    assert not registry.entry("lr").loaded
+
+
+def test_load_is_lazy_and_memory_mapped(tmp_path):
+    save(tmp_path / "lr", "v1")
+    registry = ModelRegistry(tmp_path)
+
+    model, vectorizer, label_encoder, metadata = registry.get("lr")
+
+    assert registry.entry("lr").loaded
+    assert isinstance(model["coef"], np.memmap)
+    assert registry.get("lr")[0] is model
+
+
+def test_resave_between_index_and_load_keeps_indexed_version(tmp_path):
+    save(tmp_path / "lr", "v1")
+    registry = ModelRegistry(tmp_path)
+
+    # a newer version lands before anything asked for lr
+    save(tmp_path / "lr", "v2")
+    model, vectorizer, label_encoder, metadata = registry.get("lr")
+
+    assert model["version"] == vectorizer["version"] == label_encoder["version"] == metadata["saved_at"] == "v1"
+
+    assert registry.refresh() == ["lr"]
+    model, vectorizer, label_encoder, metadata = registry.get("lr")
+    assert model["version"] == vectorizer["version"] == metadata["saved_at"] == "v2"
+
+
+def test_partial_save_is_not_picked_up(tmp_path):
+    save(tmp_path / "lr", "v1")
+    registry = ModelRegistry(tmp_path)
+
+    # a save that has started writing v2 but not switched CURRENT yet
+    partial = tmp_path / "lr" / "v2"
+    partial.mkdir()
+    joblib.dump({"version": "v2"}, partial / "model.joblib")
+
+    assert registry.refresh() == []
+    assert registry.get("lr")[0]["version"] == "v1"
+
+
+def test_hot_swap_keeps_old_artifacts_for_holders(tmp_path):
+    save(tmp_path / "lr", "v1")
+    registry = ModelRegistry(tmp_path)
+    old_model = registry.get("lr")[0]
+
+    save(tmp_path / "lr", "v2")
+    registry.refresh()
+
+    assert old_model["version"] == "v1"
+    assert registry.get("lr")[0]["version"] == "v2"
+
+
+def test_flat_dir_is_loaded_directly(tmp_path):
+    save_flat(tmp_path / "dt", "v1")
+    registry = ModelRegistry(tmp_path)
+
+    model, vectorizer, label_encoder, metadata = registry.get("dt")
+
+    assert model["version"] == metadata["saved_at"] == "v1"
+    assert registry.entry("dt").path == tmp_path / "dt"
+
+
+def test_save_version_defaults_to_timestamp(tmp_path):
+    version_dir = save_version(tmp_path / "lr", {}, {}, {}, {"model_type": "logistic_regression"})
+
+    assert (tmp_path / "lr" / "CURRENT").read_text().strip() == version_dir.name
+    assert not (tmp_path / "lr" / "CURRENT.tmp").exists()
+    assert json.loads((version_dir / "metadata.json").read_text())["saved_at"].endswith("Z")
+
+
+def test_metadata_read_failure_keeps_served_entry(tmp_path):
+    version_dir = save(tmp_path / "lr", "v1")
+    registry = ModelRegistry(tmp_path)
+    registry.get("lr")
+
+    # metadata.json caught mid-write
+    (version_dir / "metadata.json").write_text('{"model_type": "logi')
+
+    assert registry.refresh() == []
+    assert registry.get("lr")[3]["saved_at"] == "v1"
+
+
+def test_removed_model_is_evicted(tmp_path):
+    save(tmp_path / "lr", "v1")
+    save_flat(tmp_path / "dt", "v1")
+    registry = ModelRegistry(tmp_path)
+
+    (tmp_path / "dt" / "metadata.json").unlink()
+
+    assert registry.refresh() == ["dt"]
+    with pytest.raises(KeyError):
+        registry.get("dt")
+
+
+def test_load_artifacts_follows_current(tmp_path):
+    save(tmp_path / "lr", "v1")
+    save(tmp_path / "lr", "v2")
+
+    assert load_artifacts(tmp_path / "lr")[3]["saved_at"] == "v2"
@@ -0,0 +1,91 @@
+import argparse
+import json
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+from preprocess_dataset.vectorize import (DEFAULT_FEATURES, build_vectorizer, feature_report, matrix_nbytes,
+                                          resolve_features, vectorize_fit_transform)
+from train import int_or_float
+
+TRAIN = ["i want a cheap restaurant", "thank you goodbye", "is there anything else", "cheap italian food please"]
+TEST = ["cheap food", "goodbye"]
+
+
+def test_defaults_match_plain_count_vectorizer():
+    assert resolve_features() == DEFAULT_FEATURES
+    assert build_vectorizer().get_params() == CountVectorizer().get_params()
+
+
+def test_none_keeps_default():
+    assert resolve_features({'min_df': None, 'dtype': None}) == DEFAULT_FEATURES
+
+
+def test_tfidf_needs_float_dtype():
+    with pytest.raises(ValueError, match="float dtype"):
+        resolve_features({'tfidf': True, 'dtype': 'int32'})
+    assert isinstance(build_vectorizer({'tfidf': True, 'dtype': 'float32'}), TfidfVectorizer)
+
+
+@pytest.mark.parametrize("min_df", [1.5, 0, 0.0, True, -1, "2"])
+def test_invalid_min_df_is_rejected(min_df):
+    with pytest.raises(ValueError, match="min_df"):
+        resolve_features({'min_df': min_df})
+
+
+@pytest.mark.parametrize("features", [{'max_features': 0}, {'max_features': 2.5}, {'ngram_range': [2, 1]},
+                                      {'ngram_range': [0, 1]}, {'analyzer': 'sentence'}, {'dtype': 'int8'},
+                                      {'lowercase': False}])
+def test_invalid_options_are_rejected(features):
+    with pytest.raises(ValueError):
+        resolve_features(features)
+
+
+@pytest.mark.parametrize("value, expected", [("2", 2), ("0.5", 0.5), ("1e-3", 0.001), ("1.0", 1.0)])
+def test_int_or_float(value, expected):
+    result = int_or_float(value)
+    assert result == expected and type(result) is type(expected)
+
+
+@pytest.mark.parametrize("value", ["1.5", "2.0", "0.0", "True", "abc"])
+def test_int_or_float_rejects(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        int_or_float(value)
+
+
+def test_features_round_trip_through_metadata_json():
+    features = resolve_features({'analyzer': 'char_wb', 'ngram_range': (2, 4), 'tfidf': True,
+                                 'max_features': 50, 'min_df': 0.25, 'dtype': 'float32'})
+    meta = json.loads(json.dumps({'features': features}))
+
+    assert resolve_features(meta['features']) == features
+    assert build_vectorizer(meta['features']).get_params() == build_vectorizer(features).get_params()
+
+
+@pytest.mark.parametrize("features, dtype", [({'dtype': 'int32'}, np.int32),
+                                             ({'binary': True, 'dtype': 'int32'}, np.int32),
+                                             ({'tfidf': True, 'dtype': 'float32'}, np.float32),
+                                             ({}, np.int64)])
+def test_matrix_dtype_follows_config(features, dtype):
+    x_train, x_test = vectorize_fit_transform(build_vectorizer(features), TRAIN, TEST)
+    assert x_train.dtype == dtype and x_test.dtype == dtype
+
+
+def test_binary_counts():
+    x_train, _ = vectorize_fit_transform(build_vectorizer({'binary': True}), ["cheap cheap cheap food"], TEST)
+    assert x_train.max() == 1
+
+
+def test_feature_report():
+    vectorizer = build_vectorizer({'dtype': 'int32'})
+    x_train, _ = vectorize_fit_transform(vectorizer, TRAIN, TEST)
+
+    report = feature_report(vectorizer, TRAIN, x_train, repeats=1)
+
+    assert set(report) == {'n_features', 'nnz', 'dtype', 'matrix_bytes', 'transform_docs_per_sec'}
+    assert report['n_features'] == len(vectorizer.vocabulary_)
+    assert report['nnz'] == x_train.nnz
+    assert report['dtype'] == 'int32'
+    # int32 values + int32 column indices + int32 row pointers
+    assert report['matrix_bytes'] == matrix_nbytes(x_train) == 4 * x_train.nnz * 2 + 4 * (len(TRAIN) + 1)
+    assert report['transform_docs_per_sec'] > 0
@@ -1,13 +1,26 @@
-from preprocess_dataset import prepare_dataset
+from preprocess_dataset import prepare_dataset, resolve_features
 from sklearn.linear_model import LogisticRegression
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 import pandas as pd
 import argparse
 from pathlib import Path
-import json
-from datetime import datetime
-import joblib
+from model_registry import save_version
+
+
+def int_or_float(value):
+    # min_df is an absolute document count when int, a proportion of documents when float
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        proportion = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an int or a float, got {value!r}")
+    if not 0 < proportion <= 1:
+        raise argparse.ArgumentTypeError(f"a float min_df is a proportion of documents and must be in (0, 1], got {value}")
+    return proportion
 
 
 def main():
@@ -30,10 +43,55 @@ def main():
         default=None,
         help="Directory to save trained artifacts (model, vectorizer, encoder). If omitted, nothing is saved.",
     )
+    # feature extraction options (omitted flags keep the plain CountVectorizer defaults)
+    parser.add_argument(
+        "--analyzer",
+        choices=["word", "char", "char_wb"],
+        help="Build n-grams from words or characters (default: word)",
+    )
+    parser.add_argument(
+        "--ngram",
+        type=int,
+        nargs=2,
+        metavar=("MIN", "MAX"),
+        help="N-gram range, e.g. --ngram 1 2 (default: 1 1)",
+    )
+    parser.add_argument("--tfidf", action="store_true", help="Use TF-IDF weights instead of counts (needs a float dtype)")
+    parser.add_argument("--binary", action="store_true", help="Use 0/1 presence instead of counts")
+    parser.add_argument("--max-features", type=int, help="Keep only the top N terms by frequency")
+    parser.add_argument(
+        "--min-df",
+        type=int_or_float,
+        help="Ignore terms in fewer than N documents (int) or a fraction of documents (float) (default: 1)",
+    )
+    parser.add_argument(
+        "--dtype",
+        choices=["int32", "int64", "float32", "float64"],
+        help="Dtype of the feature matrix (default: int64, or float64 with --tfidf)",
+    )
     args = parser.parse_args()
 
+    features = {
+        "analyzer": args.analyzer,
+        "ngram_range": args.ngram,
+        "tfidf": args.tfidf,
+        "binary": args.binary,
+        "max_features": args.max_features,
+        "min_df": args.min_df,
+        "dtype": args.dtype or ("float64" if args.tfidf else None),
+    }
+    # validate before loading the dataset so a bad combination fails fast with a usage message
+    try:
+        features = resolve_features(features)
+    except ValueError as e:
+        parser.error(str(e))
+
     # preprocess dataset and get train/test splits. split is done in a stratified manner
-    data = prepare_dataset(args.data)
+    # options that are valid on their own can still fail once fitted on the data (min_df too high, nothing left after pruning)
+    try:
+        data = prepare_dataset(args.data, features=features)
+    except ValueError as e:
+        parser.error(str(e))
     x_train, x_test, y_train, y_test = data['x_train'], data['x_test'], data['y_train'], data['y_test']
     label_encoder = data['encoder']
     vectorizer = data['vectorizer']
@@ -61,21 +119,15 @@ def main():
 
     # optionally save artifacts
     if args.save_dir:
-        out_dir = Path(args.save_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        joblib.dump(classifier, out_dir / "model.joblib")
-        joblib.dump(vectorizer, out_dir / "vectorizer.joblib")
-        joblib.dump(label_encoder, out_dir / "label_encoder.joblib")
-
         meta = {
             "model_type": args.model,
             "dataset": args.data,
             "classes": list(label_encoder.classes_),
-            "saved_at": datetime.utcnow().isoformat() + "Z",
+            "features": data['features'],
+            "feature_report": data['feature_report'],
         }
-        (out_dir / "metadata.json").write_text(json.dumps(meta, indent=2))
-        print(f"\nSaved artifacts to: {out_dir}")
+        version_dir = save_version(Path(args.save_dir), classifier, vectorizer, label_encoder, meta)
+        print(f"\nSaved artifacts to: {version_dir}")
 
 if __name__ == "__main__":
     main()